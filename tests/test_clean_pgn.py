@@ -2,7 +2,7 @@
 # pylint: disable=redefined-outer-name
 # 65 statements, 6 missed, 91% coverage
 
-import subprocess
+import runpy
 import sys
 from unittest import mock
 import pytest
@@ -42,6 +42,10 @@ TWO_GAMES = (
     "1. d4 d5 0-1\n"
 )
 
+# The fixtures are pure ASCII; encode once so tests can use write_bytes
+SINGLE_GAME_BYTES = SINGLE_GAME.encode("utf-8")
+TWO_GAMES_BYTES = TWO_GAMES.encode("utf-8")
+
 
 class TestCleanPgnBasic:
     """Core formatting behaviour."""
@@ -49,25 +53,25 @@ class TestCleanPgnBasic:
     def test_single_game_preserves_headers_and_moves(self, tmp_paths):
         """A well-formed single game should come through intact."""
         inp, out = tmp_paths
-        inp.write_text(SINGLE_GAME)
+        inp.write_bytes(SINGLE_GAME_BYTES)
         clean_pgn(str(inp), str(out))
 
-        result = out.read_text()
-        assert '[Event "Rated Blitz game"]' in result
-        assert '[White "Alice"]' in result
-        assert "1. e4 e5 2. Nf3 Nc6 1-0" in result
+        result = out.read_bytes()
+        assert b'[Event "Rated Blitz game"]' in result
+        assert b'[White "Alice"]' in result
+        assert b"1. e4 e5 2. Nf3 Nc6 1-0" in result
 
     def test_two_games_both_present(self, tmp_paths):
         """Multiple games separated by blank lines should all be kept."""
         inp, out = tmp_paths
-        inp.write_text(TWO_GAMES)
+        inp.write_bytes(TWO_GAMES_BYTES)
         clean_pgn(str(inp), str(out))
 
-        result = out.read_text()
-        assert '[Event "Game 1"]' in result
-        assert '[Event "Game 2"]' in result
-        assert "1. e4 e5 1-0" in result
-        assert "1. d4 d5 0-1" in result
+        result = out.read_bytes()
+        assert b'[Event "Game 1"]' in result
+        assert b'[Event "Game 2"]' in result
+        assert b"1. e4 e5 1-0" in result
+        assert b"1. d4 d5 0-1" in result
 
     def test_multiline_moves_joined(self, tmp_paths):
         """Move text split across lines should be joined into one line."""
@@ -133,17 +137,17 @@ class TestCleanPgnEdgeCases:
         r"""\\r\\n line endings should be handled without breaking parsing."""
         inp, out = tmp_paths
         pgn = (
-            '[Event "Test"]\r\n'
-            '[Result "1-0"]\r\n'
-            "\r\n"
-            "1. e4 e5 1-0\r\n"
+            b'[Event "Test"]\r\n'
+            b'[Result "1-0"]\r\n'
+            b"\r\n"
+            b"1. e4 e5 1-0\r\n"
         )
-        inp.write_bytes(pgn.encode("utf-8"))
+        inp.write_bytes(pgn)
         clean_pgn(str(inp), str(out))
 
-        result = out.read_text()
-        assert '[Event "Test"]' in result
-        assert "1. e4 e5 1-0" in result
+        result = out.read_bytes()
+        assert b'[Event "Test"]' in result
+        assert b"1. e4 e5 1-0" in result
 
     def test_missing_input_file_does_not_crash(self, tmp_paths, capsys):
         """A nonexistent input path should print an error, not raise."""
@@ -178,7 +182,7 @@ class TestCleanPgnEdgeCases:
     def test_output_to_invalid_directory(self, tmp_paths, capsys):
         """Writing to a nonexistent directory prints an error."""
         inp, _ = tmp_paths
-        inp.write_text(SINGLE_GAME)
+        inp.write_bytes(SINGLE_GAME_BYTES)
         bad_out = "/no/such/dir/output.pgn"
         clean_pgn(str(inp), bad_out)
         captured = capsys.readouterr()
@@ -187,7 +191,7 @@ class TestCleanPgnEdgeCases:
     def test_permission_error_on_output(self, tmp_paths, capsys):
         """PermissionError writing output prints an error."""
         inp, out = tmp_paths
-        inp.write_text(SINGLE_GAME)
+        inp.write_bytes(SINGLE_GAME_BYTES)
         real_open = open
 
         def selective_open(*args, **kwargs):
@@ -203,7 +207,7 @@ class TestCleanPgnEdgeCases:
     def test_os_error_on_output(self, tmp_paths, capsys):
         """Generic OSError writing output prints an error."""
         inp, out = tmp_paths
-        inp.write_text(SINGLE_GAME)
+        inp.write_bytes(SINGLE_GAME_BYTES)
         real_open = open
 
         def selective_open(*args, **kwargs):
@@ -251,23 +255,24 @@ class TestCleanPgnSingleNewlineSplit:
 class TestCleanPgnMainBlock:
     """The __main__ CLI entrypoint."""
 
-    def test_main_with_valid_args(self, tmp_paths):
+    def test_main_with_valid_args(self, tmp_paths, monkeypatch, capsys):
         """Running as a script with two args should succeed."""
         inp, out = tmp_paths
         inp.write_text(SINGLE_GAME)
-        result = subprocess.run(
-            [sys.executable, "scripts/clean_pgn.py",
-             str(inp), str(out)],
-            capture_output=True, text=True, check=False,
+        monkeypatch.setattr(
+            sys, "argv", ["clean_pgn.py", str(inp), str(out)]
         )
-        assert result.returncode == 0
-        assert "Cleaned 1 games" in result.stdout
+        runpy.run_path("scripts/clean_pgn.py", run_name="__main__")
+
+        captured = capsys.readouterr()
+        assert "Cleaned 1 games" in captured.out
 
-    def test_main_with_wrong_arg_count(self):
+    def test_main_with_wrong_arg_count(self, monkeypatch, capsys):
         """Running with no args should exit with code 1."""
-        result = subprocess.run(
-            [sys.executable, "scripts/clean_pgn.py"],
-            capture_output=True, text=True, check=False,
-        )
-        assert result.returncode == 1
-        assert "Usage" in result.stdout
+        monkeypatch.setattr(sys, "argv", ["clean_pgn.py"])
+        with pytest.raises(SystemExit) as exc_info:
+            runpy.run_path("scripts/clean_pgn.py", run_name="__main__")
+
+        assert exc_info.value.code == 1
+        captured = capsys.readouterr()
+        assert "Usage" in captured.out